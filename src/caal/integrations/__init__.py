@@ -5,10 +5,13 @@ MCP integrations for voice assistant.
 from .hass import create_hass_tools, detect_hass_tool_prefix
 from .mcp_loader import MCPServerConfig, initialize_mcp_servers, load_mcp_config
 from .memory_tool import MemoryTools
-from .n8n import discover_n8n_workflows, execute_n8n_workflow
+from .n8n import clear_caches as clear_n8n_caches
+from .n8n import close_n8n_session, discover_n8n_workflows, execute_n8n_workflow
 from .web_search import WebSearchTools
 
 __all__ = [
+    "clear_n8n_caches",
+    "close_n8n_session",
     "create_hass_tools",
     "detect_hass_tool_prefix",
     "discover_n8n_workflows",
@@ -6,19 +6,70 @@ Convention:
 - Workflow descriptions in webhook node notes document expected parameters
 """
 
+import asyncio
+import functools
 import json
 import logging
+import os
+import tempfile
 import time
+from pathlib import Path
 from typing import Any
 
 import aiohttp
 
 logger = logging.getLogger(__name__)
 
-# Cache for workflow details to avoid redundant MCP calls
-_workflow_details_cache: dict[str, dict] = {}
-_cache_timestamp: float = 0
-_cache_ttl_seconds: float = 3600  # 1 hour TTL
+# Path - alongside memory data (writable /app/data volume in Docker)
+_SCRIPT_DIR = Path(__file__).parent.parent.parent.parent  # src/caal/integrations -> project root
+_DATA_DIR = Path(os.getenv("CAAL_MEMORY_DIR", _SCRIPT_DIR))
+CACHE_PATH = Path(os.getenv("CAAL_N8N_CACHE_PATH", _DATA_DIR / "n8n_workflow_cache.json"))
+
+_cache_ttl_seconds: float = 3600  # 1 hour TTL per entry
+
+# Bump when the entry layout changes; files with another version are ignored
+_CACHE_VERSION = 1
+
+# Max concurrent get_workflow_details calls during discovery
+DISCOVERY_CONCURRENCY = max(1, int(os.getenv("CAAL_N8N_DISCOVERY_CONCURRENCY", "8")))
+
+# Node type of the webhook trigger that carries a workflow's description
+_WEBHOOK_NODE_TYPE = "n8n-nodes-base.webhook"
+
+# Flexible schema shared by all workflow tools - the LLM uses the description
+# to determine parameters. Never mutated, so one instance is reused.
+_OPEN_SCHEMA = {
+    "type": "object",
+    "additionalProperties": True  # Accept any properties
+}
+
+# Characters replaced with underscores in tool names
+_SANITIZE_TABLE = str.maketrans({" ": "_", "-": "_"})
+
+class _DetailsCache:
+    """Workflow details cache state, kept off the module globals.
+
+    Persisted to CACHE_PATH so restarts don't refetch every workflow.
+
+    Attributes:
+        details: Workflow id -> {"fetched_at": unix timestamp,
+            "updated_at": listing's updatedAt, "description": str}
+        loaded: Whether CACHE_PATH has been read in this process
+        dirty: Whether details changed since the last save
+    """
+
+    __slots__ = ("details", "loaded", "dirty")
+
+    def __init__(self) -> None:
+        self.details: dict[str, dict] = {}
+        self.loaded = False
+        self.dirty = False
+
+
+_details_cache = _DetailsCache()
+
+# Shared HTTP session for webhook calls (keeps connections to n8n alive)
+_session: aiohttp.ClientSession | None = None
 
 
 async def discover_n8n_workflows(n8n_mcp, base_url: str) -> tuple[list[dict], dict[str, str]]:
@@ -39,78 +90,130 @@ async def discover_n8n_workflows(n8n_mcp, base_url: str) -> tuple[list[dict], di
     tools = []
     workflow_name_map = {}
 
-    # Check cache expiry
-    current_time = time.time()
-    global _cache_timestamp, _workflow_details_cache
-    if current_time - _cache_timestamp > _cache_ttl_seconds:
-        _workflow_details_cache.clear()
-        _cache_timestamp = current_time
-        logger.debug("Cleared workflow details cache (TTL expired)")
+    _load_cache()
 
     try:
+        # Bound once and shared by every per-workflow task
+        call_tool = n8n_mcp._client.call_tool
+        now = time.time()
+
         # Get list of workflows (basic info only)
-        result = await n8n_mcp._client.call_tool("search_workflows", {})
+        result = await call_tool("search_workflows", {})
         workflows_data = parse_mcp_result(result)
 
         # n8n returns {"data": [...], "count": N}
-        if isinstance(workflows_data, dict) and "data" in workflows_data:
+        if isinstance(workflows_data, dict) and isinstance(workflows_data.get("data"), list):
             workflows = workflows_data["data"]
         else:
+            # Leave the cache untouched; pruning against a bad listing would empty it
             logger.warning(f"Unexpected workflows format: {type(workflows_data)}")
-            workflows = []
+            return tools, workflow_name_map
 
         logger.info(f"Loading {len(workflows)} n8n workflows:")
 
-        for workflow in workflows:
-            wf_name = workflow["name"]  # Original workflow name
-            wf_id = workflow["id"]  # Need ID for get_workflow_details
-            tool_name = sanitize_tool_name(wf_name)
+        # Fetch workflow details concurrently, bounded so large workflow sets
+        # don't flood the MCP server; results keep list order
+        semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
 
-            # Try to get detailed description from webhook notes
-            description = ""
-            try:
-                # Check cache first
-                if wf_id not in _workflow_details_cache:
-                    details_result = await n8n_mcp._client.call_tool(
-                        "get_workflow_details",
-                        {"workflowId": wf_id}
-                    )
-                    _workflow_details_cache[wf_id] = parse_mcp_result(details_result)
-
-                workflow_details = _workflow_details_cache[wf_id]
-                description = extract_webhook_description(workflow_details)
-
-            except Exception as e:
-                logger.warning(f"Failed to get details for {wf_name}: {e}")
-
-            # Fallback to root description or generic message
-            if not description:
-                description = workflow.get("description") or f"Execute {tool_name} workflow"
-
-            # Flexible schema - LLM uses description to determine parameters
-            parameters = {
-                "type": "object",
-                "additionalProperties": True  # Accept any properties
-            }
+        async def _bounded(workflow: dict) -> tuple[dict, str, str]:
+            async with semaphore:
+                return await _build_workflow_tool(call_tool, workflow, now)
 
-            # Create Ollama tool definition
-            tool = {
-                "type": "function",
-                "function": {
-                    "name": tool_name,
-                    "description": description,
-                    "parameters": parameters,
-                },
-            }
+        results = await asyncio.gather(
+            *(_bounded(workflow) for workflow in workflows),
+            return_exceptions=True,
+        )
+
+        for workflow, result in zip(workflows, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to load workflow {workflow.get('name')}: {result}")
+                continue
+            tool, tool_name, wf_name = result
             tools.append(tool)
             workflow_name_map[tool_name] = wf_name  # Map sanitized -> original name
             logger.info(f"  ✓ {tool_name}")
 
+        # Drop cached details for workflows that no longer exist
+        active_ids = {workflow.get("id") for workflow in workflows}
+        details = _details_cache.details
+        for wf_id in [wf_id for wf_id in details if wf_id not in active_ids]:
+            del details[wf_id]
+            _details_cache.dirty = True
+
+        _save_cache()
+
     except Exception as e:
         logger.warning(f"Failed to discover n8n workflows: {e}", exc_info=True)
     return tools, workflow_name_map
 
 
+async def _build_workflow_tool(
+    call_tool, workflow: dict, now: float
+) -> tuple[dict, str, str]:
+    """Build the Ollama tool definition for a single workflow.
+
+    Args:
+        call_tool: The n8n MCP client's bound call_tool method
+        workflow: Workflow summary from search_workflows
+        now: Discovery start time (unix timestamp) for cache expiry
+
+    Returns:
+        Tuple of (tool, tool_name, workflow_name)
+    """
+    wf_name = workflow["name"]  # Original workflow name
+    wf_id = workflow["id"]  # Need ID for get_workflow_details
+    tool_name = sanitize_tool_name(wf_name)
+
+    # Try to get detailed description from webhook notes
+    description = ""
+    try:
+        # Check cache first (entries expire individually, and are refetched
+        # as soon as the listing reports the workflow was edited)
+        updated_at = workflow.get("updatedAt")
+        entry = _details_cache.details.get(wf_id)
+        if (
+            entry is None
+            or entry.get("updated_at") != updated_at
+            or now - entry["fetched_at"] > _cache_ttl_seconds
+        ):
+            details_result = await call_tool(
+                "get_workflow_details",
+                {"workflowId": wf_id}
+            )
+            # Keep only the extracted description, not the full workflow graph
+            workflow_details = parse_mcp_result(details_result)
+            entry = {
+                "fetched_at": now,
+                "updated_at": updated_at,
+                "description": extract_webhook_description(workflow_details),
+            }
+            _details_cache.details[wf_id] = entry
+            _details_cache.dirty = True
+
+        description = entry["description"]
+
+    except Exception as e:
+        logger.warning(f"Failed to get details for {wf_name}: {e}")
+
+    # Fallback to root description or generic message
+    if not description:
+        description = workflow.get("description") or f"Execute {tool_name} workflow"
+
+    return _make_tool(tool_name, description, _OPEN_SCHEMA), tool_name, wf_name
+
+
+def _make_tool(name: str, description: str, parameters: dict) -> dict:
+    """Create an Ollama tool definition."""
+    return {
+        "type": "function",
+        "function": {
+            "name": name,
+            "description": description,
+            "parameters": parameters,
+        },
+    }
+
+
 async def execute_n8n_workflow(base_url: str, workflow_name: str, arguments: dict) -> Any:
     """Execute an n8n workflow via POST request.
 
@@ -125,15 +228,39 @@ async def execute_n8n_workflow(base_url: str, workflow_name: str, arguments: dic
         Workflow execution result (only final node output)
     """
     webhook_url = f"{base_url.rstrip('/')}/webhook/{workflow_name}"
+    session = _get_session()
+
+    try:
+        async with session.post(webhook_url, json=arguments) as response:
+            response.raise_for_status()
+            return await response.json()
+    except aiohttp.ClientError as e:
+        logger.error(f"Failed to execute n8n workflow {workflow_name}: {e}")
+        raise
+
+
+def _get_session() -> aiohttp.ClientSession:
+    """Return the shared webhook session, creating it on first use.
+
+    Creation doesn't await, so concurrent callers on the same event loop
+    can't race here and no lock is needed.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32, limit_per_host=16, keepalive_timeout=60
+            )
+        )
+    return _session
 
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.post(webhook_url, json=arguments) as response:
-                response.raise_for_status()
-                return await response.json()
-        except aiohttp.ClientError as e:
-            logger.error(f"Failed to execute n8n workflow {workflow_name}: {e}")
-            raise
+
+async def close_n8n_session() -> None:
+    """Close the shared webhook session (call on agent shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
 
 
 def extract_webhook_description(workflow_details: dict) -> str:
@@ -149,24 +276,27 @@ def extract_webhook_description(workflow_details: dict) -> str:
         Description string for CAAL tool discovery, or empty string if not found
     """
     # Find webhook node in workflow
-    for node in workflow_details.get("workflow", {}).get("nodes", []):
-        if node.get("type") == "n8n-nodes-base.webhook":
-            # Extract notes field
-            notes = node.get("notes", "").strip()
-            if notes:
-                return notes
-
-            # Fallback: use node description if available
-            node_desc = node.get("description", "").strip()
-            if node_desc:
-                return node_desc
+    for node in workflow_details.get("workflow", {}).get("nodes") or ():
+        if node.get("type") != _WEBHOOK_NODE_TYPE:
+            continue
+
+        # Extract notes field
+        notes = node.get("notes")
+        if notes and (notes := notes.strip()):
+            return notes
+
+        # Fallback: use node description if available
+        node_desc = node.get("description")
+        if node_desc and (node_desc := node_desc.strip()):
+            return node_desc
 
     return ""
 
 
+@functools.lru_cache(maxsize=512)
 def sanitize_tool_name(name: str) -> str:
     """Convert workflow name to valid tool name (lowercase, underscores)."""
-    return name.lower().replace(" ", "_").replace("-", "_")
+    return name.lower().translate(_SANITIZE_TABLE)
 
 
 def clear_caches() -> None:
@@ -174,21 +304,76 @@ def clear_caches() -> None:
 
     Call this before re-discovering workflows to ensure fresh data.
     """
-    global _workflow_details_cache, _cache_timestamp
-    _workflow_details_cache.clear()
-    _cache_timestamp = 0
+    _details_cache.details.clear()
+    _details_cache.loaded = True  # Nothing left on disk to load
+    _details_cache.dirty = False
+    try:
+        CACHE_PATH.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Failed to delete n8n workflow cache file: {e}")
     logger.info("Cleared n8n workflow caches")
 
 
+def _load_cache() -> None:
+    """Load persisted workflow details into memory (once per process)."""
+    if _details_cache.loaded:
+        return
+    _details_cache.loaded = True
+
+    if not CACHE_PATH.exists():
+        return
+    try:
+        data = json.loads(CACHE_PATH.read_bytes())
+        if data.get("version") != _CACHE_VERSION:
+            logger.info("Ignoring n8n workflow cache from another version")
+            return
+        _details_cache.details.update(data.get("workflows", {}))
+        logger.debug(f"Loaded n8n workflow cache from {CACHE_PATH}")
+    except Exception as e:
+        logger.warning(f"Failed to load n8n workflow cache: {e}")
+
+
+def _save_cache() -> None:
+    """Write workflow details to disk if they changed (atomic replace)."""
+    if not _details_cache.dirty:
+        return
+
+    tmp_path = None
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp file per writer, so concurrent agent processes can't
+        # interleave writes into the same file before the replace
+        fd, tmp_path = tempfile.mkstemp(
+            dir=CACHE_PATH.parent, prefix=f".{CACHE_PATH.name}.", suffix=".tmp"
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": _CACHE_VERSION, "workflows": _details_cache.details}, f)
+        os.replace(tmp_path, CACHE_PATH)
+        tmp_path = None
+        _details_cache.dirty = False
+        logger.debug(f"Saved n8n workflow cache to {CACHE_PATH}")
+    except Exception as e:
+        logger.error(f"Failed to save n8n workflow cache: {e}")
+    finally:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
 def parse_mcp_result(result) -> Any:
     """Parse MCP tool result, extracting content."""
     # Handle different MCP response formats
-    if hasattr(result, "content") and result.content:
+    content = getattr(result, "content", None)
+    if content:
         # Get the first content item
-        content_item = result.content[0]
+        content_item = content[0]
 
         # Extract text from content
-        text = content_item.text if hasattr(content_item, "text") else str(content_item)
+        text = getattr(content_item, "text", None)
+        if text is None:
+            text = str(content_item)
 
         # Try to parse as JSON
         try:
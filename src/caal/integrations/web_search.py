@@ -12,6 +12,8 @@ Usage:
 
 import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from livekit.agents import function_tool
@@ -21,6 +23,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Dedicated threads for the blocking DDGS client, so searches don't queue
+# behind other work on the loop's default executor (also caps concurrency)
+_search_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="web_search")
+
+# Summaries of recent searches: (normalized query, max_results) -> (stored_at, summary)
+_search_cache: dict[tuple[str, int], tuple[float, str]] = {}
+_SEARCH_CACHE_MAX_ENTRIES = 256
+
 SUMMARIZE_PROMPT = """Summarize the following search results in 1-3 sentences for voice output.
 Be concise and conversational. Do not include URLs, markdown, or bullet points.
 Focus on directly answering what the user would want to know.
@@ -42,10 +52,12 @@ class WebSearchTools:
     Configuration (override in subclass if needed):
     - _search_max_results: int = 5
     - _search_timeout: float = 10.0
+    - _search_cache_ttl: float = 120.0 (seconds; 0 disables caching)
     """
 
     _search_max_results: int = 5
     _search_timeout: float = 10.0
+    _search_cache_ttl: float = 120.0
 
     @function_tool
     async def web_search(self, query: str) -> str:
@@ -56,6 +68,12 @@ class WebSearchTools:
         """
         logger.info(f"web_search: {query}")
 
+        # Repeat queries within the TTL skip both the search and summarization
+        cached = _search_cache.get(self._search_cache_key(query))
+        if cached and time.monotonic() - cached[0] < self._search_cache_ttl:
+            logger.info("web_search: using cached summary")
+            return cached[1]
+
         try:
             raw_results = await asyncio.wait_for(
                 self._do_search(query),
@@ -65,7 +83,12 @@ class WebSearchTools:
             if not raw_results:
                 return "I couldn't find any results for that search."
 
-            return await self._summarize_results(query, raw_results)
+            answer, summarized = await self._summarize_results(query, raw_results)
+
+            # Only real summaries are cached, so a failed summarization is retried
+            if summarized and self._search_cache_ttl > 0:
+                _store_search_summary(self._search_cache_key(query), answer)
+            return answer
 
         except asyncio.TimeoutError:
             logger.warning(f"Web search timed out for query: {query}")
@@ -75,7 +98,7 @@ class WebSearchTools:
             return "I had trouble searching the web. Please try again."
 
     async def _do_search(self, query: str) -> list[dict[str, Any]]:
-        """Execute DuckDuckGo search in thread pool (blocking API).
+        """Execute DuckDuckGo search in a dedicated thread pool (blocking API).
 
         Returns list of result dicts with 'title', 'body', 'href' keys.
         """
@@ -89,24 +112,26 @@ class WebSearchTools:
                     safesearch="moderate"
                 ))
 
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, _search)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_search_executor, _search)
 
     async def _summarize_results(
         self,
         query: str,
         results: list[dict[str, Any]]
-    ) -> str:
-        """Summarize search results with configured LLM provider."""
+    ) -> tuple[str, bool]:
+        """Summarize search results with configured LLM provider.
 
-        # Truncate to avoid exceeding context limits (~500 tokens total)
-        formatted = []
-        for i, r in enumerate(results, 1):
-            title = r.get("title", "")[:100]
-            body = r.get("body", "")[:200]
-            formatted.append(f"{i}. {title}: {body}")
+        Returns:
+            Tuple of (answer, summarized) - summarized is False when the
+            answer is a fallback (no provider, empty summary, or error)
+        """
 
-        results_text = "\n".join(formatted)
+        # Truncate to avoid exceeding context limits (~500 tokens total)
+        results_text = "\n".join(
+            f"{i}. {r.get('title', '')[:100]}: {r.get('body', '')[:200]}"
+            for i, r in enumerate(results, 1)
+        )
         prompt = SUMMARIZE_PROMPT.format(query=query, results=results_text)
 
         # Use agent's provider for summarization
@@ -114,18 +139,32 @@ class WebSearchTools:
         if provider is None:
             logger.warning("No provider available for summarization, returning raw results")
             if results:
-                return results[0].get("body", "No description available.")
-            return "I had trouble processing the search results."
+                return results[0].get("body", "No description available."), False
+            return "I had trouble processing the search results.", False
 
         try:
             messages = [{"role": "user", "content": prompt}]
             response = await provider.chat(messages=messages)
             summary = (response.content or "").strip()
-            return summary or "I found some results but couldn't summarize them."
+            if summary:
+                return summary, True
+            return "I found some results but couldn't summarize them.", False
 
         except Exception as e:
             logger.error(f"Summarization error: {e}")
             # Fallback: return first result's snippet
             if results:
-                return results[0].get("body", "No description available.")
-            return "I had trouble processing the search results."
+                return results[0].get("body", "No description available."), False
+            return "I had trouble processing the search results.", False
+
+    def _search_cache_key(self, query: str) -> tuple[str, int]:
+        """Cache key for a query: normalized text plus result count."""
+        return (query.strip().lower(), self._search_max_results)
+
+
+def _store_search_summary(key: tuple[str, int], summary: str) -> None:
+    """Cache a search summary, evicting the oldest entries past the size cap."""
+    _search_cache.pop(key, None)  # Re-insert so the entry moves to the end
+    _search_cache[key] = (time.monotonic(), summary)
+    while len(_search_cache) > _SEARCH_CACHE_MAX_ENTRIES:
+        del _search_cache[next(iter(_search_cache))]
@@ -20,10 +20,12 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import json
 import logging
 import time
+from collections import deque
 from collections.abc import AsyncIterable
 from typing import TYPE_CHECKING, Any
 
@@ -39,6 +41,13 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["llm_node", "ToolDataCache"]
 
+# Strong references to in-flight tool status tasks (the event loop only keeps
+# weak ones, so an unreferenced task can be garbage collected mid-flight)
+_status_tasks: set[asyncio.Task] = set()
+
+# JSON schema types for annotated @function_tool parameters (default: string)
+_PARAM_TYPES = {str: "string", int: "integer", float: "number", bool: "boolean"}
+
 
 class ToolDataCache:
     """Caches recent tool response data for context injection.
@@ -50,28 +59,39 @@ class ToolDataCache:
 
     def __init__(self, max_entries: int = 3):
         self.max_entries = max_entries
-        self._cache: list[dict] = []
+        # Bounded window: appending past max_entries drops the oldest entry
+        self._cache: deque[dict] = deque(maxlen=max_entries)
+        # Rendered context message, rebuilt only when entries change
+        self._context_message: str | None = None
 
     def add(self, tool_name: str, data: Any, arguments: dict | None = None) -> None:
         """Add tool call and response data to cache."""
-        entry = {"tool": tool_name, "args": arguments, "data": data, "timestamp": time.time()}
+        # Serialize once here; get_context_message runs on every LLM call
+        args = json.dumps(arguments) if arguments else ""
+        entry = {
+            "tool": tool_name,
+            "args": arguments,
+            "data": data,
+            "timestamp": time.time(),
+            "line": f"\n{tool_name}({args}) → {json.dumps(data)}",
+        }
         self._cache.append(entry)
-        if len(self._cache) > self.max_entries:
-            self._cache.pop(0)  # Remove oldest
+        self._context_message = None
 
     def get_context_message(self) -> str | None:
         """Format cached data as context string for LLM injection."""
         if not self._cache:
             return None
-        parts = ["Recent tool calls and responses for reference:"]
-        for entry in self._cache:
-            args = json.dumps(entry['args']) if entry.get('args') else ''
-            parts.append(f"\n{entry['tool']}({args}) → {json.dumps(entry['data'])}")
-        return "\n".join(parts)
+        if self._context_message is None:
+            parts = ["Recent tool calls and responses for reference:"]
+            parts.extend(entry["line"] for entry in self._cache)
+            self._context_message = "\n".join(parts)
+        return self._context_message
 
     def clear(self) -> None:
         """Clear the cache."""
         self._cache.clear()
+        self._context_message = None
 
 
 async def llm_node(
@@ -190,12 +210,7 @@ async def llm_node(
                 all_tool_names.extend(tc.name for tc in response.tool_calls)
                 all_tool_params.extend(tc.arguments for tc in response.tool_calls)
 
-                if hasattr(agent, "_on_tool_status") and agent._on_tool_status:
-                    import asyncio
-
-                    asyncio.create_task(
-                        agent._on_tool_status(True, all_tool_names, all_tool_params)
-                    )
+                _publish_tool_status(agent, True, all_tool_names, all_tool_params)
 
                 messages = await _execute_tool_calls(
                     agent,
@@ -215,10 +230,8 @@ async def llm_node(
 
         # Stream final response (after tool chain or no tools)
         # Only clear tool indicator if no tools were called this turn
-        if tool_round == 0 and hasattr(agent, "_on_tool_status") and agent._on_tool_status:
-            import asyncio
-
-            asyncio.create_task(agent._on_tool_status(False, [], []))
+        if tool_round == 0:
+            _publish_tool_status(agent, False, [], [])
 
         if tool_round > 0:
             # After tool execution — pass tools so Ollama can validate
@@ -248,6 +261,22 @@ async def llm_node(
         yield f"I encountered an error: {e}"
 
 
+def _publish_tool_status(
+    agent, tool_used: bool, tool_names: list[str], tool_params: list[dict]
+) -> None:
+    """Publish tool status without blocking the LLM turn.
+
+    The callback sends a data packet to the frontend, so it runs as a
+    background task; a reference is held until it finishes.
+    """
+    callback = getattr(agent, "_on_tool_status", None)
+    if not callback:
+        return
+    task = asyncio.create_task(callback(tool_used, tool_names, tool_params))
+    _status_tasks.add(task)
+    task.add_done_callback(_status_tasks.discard)
+
+
 def _strip_tool_messages(messages: list[dict]) -> list[dict]:
     """Convert tool call/result messages to plain text.
 
@@ -388,9 +417,26 @@ async def _discover_tools(agent) -> list[dict] | None:
     redundant MCP API calls on every user utterance.
     """
     # Return cached tools if available
-    if hasattr(agent, "_llm_tools_cache") and agent._llm_tools_cache is not None:
+    if getattr(agent, "_llm_tools_cache", None) is not None:
         return agent._llm_tools_cache
 
+    # Only one turn discovers; concurrent turns wait and reuse its result
+    lock = getattr(agent, "_llm_tools_lock", None)
+    if lock is None:
+        lock = agent._llm_tools_lock = asyncio.Lock()
+
+    async with lock:
+        if getattr(agent, "_llm_tools_cache", None) is not None:
+            return agent._llm_tools_cache
+
+        # Cache tools on agent and return
+        result = await _collect_tools(agent)
+        agent._llm_tools_cache = result
+        return result
+
+
+async def _collect_tools(agent) -> list[dict] | None:
+    """Collect tool definitions from agent methods, MCP servers, n8n and HASS."""
     tools = []
 
     # Get @function_tool decorated methods from agent (bound methods on class)
@@ -407,18 +453,10 @@ async def _discover_tools(agent) -> list[dict] | None:
                 for param_name, param in sig.parameters.items():
                     if param_name == "self":
                         continue
-                    param_type = "string"
-                    if param.annotation is not inspect.Parameter.empty:
-                        if param.annotation is str:
-                            param_type = "string"
-                        elif param.annotation is int:
-                            param_type = "integer"
-                        elif param.annotation is float:
-                            param_type = "number"
-                        elif param.annotation is bool:
-                            param_type = "boolean"
-                    properties[param_name] = {"type": param_type}
-                    if param.default is inspect.Parameter.empty and param_name != "self":
+                    properties[param_name] = {
+                        "type": _PARAM_TYPES.get(param.annotation, "string")
+                    }
+                    if param.default is inspect.Parameter.empty:
                         required.append(param_name)
 
                 tools.append(
@@ -462,11 +500,7 @@ async def _discover_tools(agent) -> list[dict] | None:
     if hasattr(agent, "_hass_tool_definitions") and agent._hass_tool_definitions:
         tools.extend(agent._hass_tool_definitions)
 
-    # Cache tools on agent and return
-    result = tools if tools else None
-    agent._llm_tools_cache = result
-
-    return result
+    return tools if tools else None
 
 
 async def _get_mcp_tools(mcp_server) -> list[dict]:
@@ -127,6 +127,7 @@ SENSITIVE_KEYS: set[str] = set()  # All keys returned - shown as dots in passwor
 
 # Cached settings (reloaded on save)
 _settings_cache: dict | None = None
+_user_settings_cache: dict | None = None
 
 
 def load_settings() -> dict:
@@ -224,13 +225,22 @@ def load_user_settings() -> dict:
         Dict with only keys explicitly set by the user in settings.json.
         Empty dict if file doesn't exist or is empty.
     """
+    global _user_settings_cache
+
+    if _user_settings_cache is not None:
+        return _user_settings_cache
+
     if SETTINGS_PATH.exists():
         try:
             with open(SETTINGS_PATH) as f:
-                return json.load(f)
+                _user_settings_cache = json.load(f)
+            return _user_settings_cache
         except Exception as e:
             logger.warning(f"Failed to load user settings from {SETTINGS_PATH}: {e}")
-    return {}
+            return {}
+
+    _user_settings_cache = {}
+    return _user_settings_cache
 
 
 def save_settings(settings: dict) -> None:
@@ -241,7 +251,7 @@ def save_settings(settings: dict) -> None:
                   Only keys in DEFAULT_SETTINGS are saved.
                   Existing settings are preserved unless explicitly overwritten.
     """
-    global _settings_cache
+    global _settings_cache, _user_settings_cache
 
     # Load existing settings first
     existing = load_user_settings()
@@ -259,8 +269,9 @@ def save_settings(settings: dict) -> None:
         with open(SETTINGS_PATH, "w") as f:
             json.dump(filtered, f, indent=2)
 
-        # Invalidate cache
+        # Invalidate caches
         _settings_cache = None
+        _user_settings_cache = None
 
         logger.info(f"Saved settings to {SETTINGS_PATH}")
     except Exception as e:
@@ -290,8 +301,9 @@ def reload_settings() -> dict:
     Returns:
         Fresh settings dict
     """
-    global _settings_cache
+    global _settings_cache, _user_settings_cache
     _settings_cache = None
+    _user_settings_cache = None
     return load_settings()
 
 
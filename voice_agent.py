@@ -51,6 +51,8 @@ from caal import CAALLLM  # noqa: E402
 from caal.integrations import (  # noqa: E402
     MemoryTools,
     WebSearchTools,
+    clear_n8n_caches,
+    close_n8n_session,
     create_hass_tools,
     detect_hass_tool_prefix,
     discover_n8n_workflows,
@@ -280,6 +282,9 @@ async def entrypoint(ctx: agents.JobContext) -> None:
     logger.debug(f"Joining room: {ctx.room.name}")
     await ctx.connect()
 
+    # Runs however the job ends, including errors and cancellation
+    ctx.add_shutdown_callback(close_n8n_session)
+
     # Load MCP servers from config
     mcp_servers = {}
     mcp_errors = []
@@ -323,12 +328,20 @@ async def entrypoint(ctx: agents.JobContext) -> None:
         except Exception as e:
             logger.error(f"Failed to send MCP error to frontend: {e}")
 
-    # Discover n8n workflows (n8n uses webhook-based execution, not MCP tools)
+    # n8n workflows and Home Assistant tools use different MCP servers,
+    # so set both up concurrently
     n8n_workflow_tools = []
     n8n_workflow_name_map = {}
     n8n_base_url = None
-    n8n_mcp = mcp_servers.get("n8n")
-    if n8n_mcp:
+    hass_tool_definitions = []
+    hass_tool_callables = {}
+
+    async def _init_n8n() -> None:
+        """Discover n8n workflows (webhook-based execution, not MCP tools)."""
+        nonlocal n8n_workflow_tools, n8n_workflow_name_map, n8n_base_url
+        n8n_mcp = mcp_servers.get("n8n")
+        if not n8n_mcp:
+            return
         try:
             # Extract base URL from n8n MCP server config
             n8n_config = next((c for c in mcp_configs if c.name == "n8n"), None)
@@ -344,6 +357,28 @@ async def entrypoint(ctx: agents.JobContext) -> None:
         except Exception as e:
             logger.error(f"Failed to discover n8n workflows: {e}")
 
+    async def _init_hass() -> None:
+        """Create HASS tools only if Home Assistant is connected."""
+        nonlocal hass_tool_definitions, hass_tool_callables
+        hass_server = mcp_servers.get("home_assistant")
+        if not hass_server:
+            return
+        # Detect tool prefix (some HA MCP servers use 'assist__' prefix)
+        hass_tool_prefix = await detect_hass_tool_prefix(hass_server)
+        if hass_tool_prefix:
+            logger.info(f"Home Assistant MCP uses '{hass_tool_prefix}' prefix")
+        hass_tool_definitions, hass_tool_callables = create_hass_tools(
+            hass_server, tool_prefix=hass_tool_prefix
+        )
+        logger.info("Home Assistant tools enabled: hass")
+
+    for name, result in zip(
+        ("n8n", "Home Assistant"),
+        await asyncio.gather(_init_n8n(), _init_hass(), return_exceptions=True),
+    ):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to set up {name} tools: {result}")
+
     # Get runtime settings (from settings.json with .env fallback)
     runtime = get_runtime_settings()
 
@@ -582,20 +617,6 @@ async def entrypoint(ctx: agents.JobContext) -> None:
 
     # ==========================================================================
 
-    # Create HASS tools only if Home Assistant is connected
-    hass_tool_definitions = []
-    hass_tool_callables = {}
-    hass_server = mcp_servers.get("home_assistant")
-    if hass_server:
-        # Detect tool prefix (some HA MCP servers use 'assist__' prefix)
-        hass_tool_prefix = await detect_hass_tool_prefix(hass_server)
-        if hass_tool_prefix:
-            logger.info(f"Home Assistant MCP uses '{hass_tool_prefix}' prefix")
-        hass_tool_definitions, hass_tool_callables = create_hass_tools(
-            hass_server, tool_prefix=hass_tool_prefix
-        )
-        logger.info("Home Assistant tools enabled: hass")
-
     # Initialize short-term memory (singleton, persists across restarts)
     short_term_memory = ShortTermMemory()
     memory_count = len(short_term_memory.list_keys())
@@ -656,13 +677,12 @@ async def entrypoint(ctx: agents.JobContext) -> None:
                 await session.say(greeting)
 
             elif action == "reload_tools":
-                # Clear agent's internal caches
-                assistant._ollama_tools_cache = None
-
-                # Re-discover n8n workflows if MCP is available
+                # Rebuild in place: MCP connections are kept, workflow details
+                # are dropped so edited webhook notes are picked up
                 n8n_mcp = assistant._caal_mcp_servers.get("n8n")
                 if n8n_mcp and assistant._n8n_base_url:
                     try:
+                        clear_n8n_caches()
                         tools, name_map = await discover_n8n_workflows(
                             n8n_mcp, assistant._n8n_base_url
                         )
@@ -672,6 +692,9 @@ async def entrypoint(ctx: agents.JobContext) -> None:
                     except Exception as e:
                         logger.error(f"Failed to re-discover n8n workflows: {e}")
 
+                # Drop the merged tool list so the next LLM call picks up changes
+                assistant._llm_tools_cache = None
+
                 # Announce if requested
                 if msg := cmd.get("message"):
                     await session.say(msg)